@@ -32,19 +32,23 @@ import sys
 try:
     # Python3 and Python2 with future package.
     from http.server import SimpleHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
 except ImportError:
     from BaseHTTPServer import HTTPServer
     from SimpleHTTPServer import SimpleHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
 
 
 class RequestHandler(SimpleHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
     def end_headers(self):
         self.send_header('Access-Control-Allow-Origin', '*')
         SimpleHTTPRequestHandler.end_headers(self)
 
 
-class Server(HTTPServer):
-    protocol_version = 'HTTP/1.1'
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
 
     def __init__(self, server_address):
         HTTPServer.__init__(self, server_address, RequestHandler)
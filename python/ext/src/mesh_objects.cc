@@ -17,6 +17,7 @@
 #include "mesh_objects.h"
 
 #include <cstddef>
+#include <vector>
 
 #ifdef USE_OMP
 #include <omp.h>
@@ -51,6 +52,47 @@ void MeshObjects(const Label* labels, const Vector3d& size,
     corner_label_offset[i] = offset;
   }
 
+  // Indices into cube_corner_position_offsets of the corners with x offset 0
+  // and the corresponding corners with x offset 1.
+  constexpr int prev_face_corners[4] = {0, 3, 4, 7};
+  constexpr int next_face_corners[4] = {1, 2, 5, 6};
+
+  // Coarse pass: determine which rows of voxels along x contain a single
+  // label.  A row of cubes whose four voxel rows are all uniform with the same
+  // label contains no surface and is skipped by the meshing pass below, which
+  // otherwise is repeated by every thread.
+  const int64_t num_rows = size[1] * size[2];
+  std::vector<uint8_t> row_is_uniform(num_rows);
+  std::vector<uint64_t> row_label(num_rows);
+#ifdef USE_OMP
+#pragma omp parallel for
+#endif
+  for (int64_t row = 0; row < num_rows; ++row) {
+    auto const* labels_row =
+        labels + (row % size[1]) * strides[1] + (row / size[1]) * strides[2];
+    const Label first_label = labels_row[0];
+    bool uniform = true;
+    for (int64_t x = 1; x < size[0]; ++x) {
+      if (labels_row[x * strides[0]] != first_label) {
+        uniform = false;
+        break;
+      }
+    }
+    row_is_uniform[row] = uniform;
+    row_label[row] = first_label;
+  }
+
+  auto is_uniform_cube_row = [&](int64_t y, int64_t z) {
+    const int64_t row = y + z * size[1];
+    const int64_t rows[4] = {row, row + 1, row + size[1], row + size[1] + 1};
+    for (int64_t r : rows) {
+      if (!row_is_uniform[r] || row_label[r] != row_label[row]) {
+        return false;
+      }
+    }
+    return true;
+  };
+
   output->clear();
 
 #ifdef USE_OMP
@@ -69,17 +111,33 @@ void MeshObjects(const Label* labels, const Vector3d& size,
     for (int64_t z = 0; z < adjusted_size[2]; ++z, labels_z += strides[2]) {
       auto const* labels_y = labels_z;
       for (int64_t y = 0; y < adjusted_size[1]; ++y, labels_y += strides[1]) {
+        if (is_uniform_cube_row(y, z)) {
+          continue;
+        }
         auto const* labels_x = labels_y;
+        // Consecutive cubes along x share a face: the corners at x offset 1
+        // of one cube are the corners at x offset 0 of the next.  Only the
+        // four corners of the far face are loaded for each cube.
+        std::array<uint64_t, 8> label_at_corners;
+        for (int i = 0; i < 4; ++i) {
+          label_at_corners[next_face_corners[i]] =
+              labels_x[corner_label_offset[prev_face_corners[i]]];
+        }
         for (int64_t x = 0; x < adjusted_size[0]; ++x, labels_x += strides[0]) {
           // We need to call AddCube once per distinct non-zero label
           // contained within the 2x2x2 voxel region.  This thread will only
           // handle labels equivalent to thread_num (mod num_threads).
-          std::array<uint64_t, 8> label_at_corners;
-          label_at_corners[0] = labels_x[corner_label_offset[0]];
           bool not_all_same = false;
-          for (int i = 1; i < 8; ++i) {
-            auto label = label_at_corners[i] = labels_x[corner_label_offset[i]];
-            if (label != label_at_corners[0]) {
+          for (int i = 0; i < 4; ++i) {
+            label_at_corners[prev_face_corners[i]] =
+                label_at_corners[next_face_corners[i]];
+          }
+          const uint64_t first_label = label_at_corners[0];
+          for (int i = 0; i < 4; ++i) {
+            auto label = label_at_corners[next_face_corners[i]] =
+                labels_x[corner_label_offset[next_face_corners[i]]];
+            if (label != first_label ||
+                label_at_corners[prev_face_corners[i]] != first_label) {
               not_all_same = true;
             }
           }
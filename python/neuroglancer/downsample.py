@@ -27,13 +27,24 @@ def downsample_with_averaging(array, factor):
     factor = tuple(factor)
     output_shape = tuple(int(math.ceil(s / f)) for s, f in zip(array.shape, factor))
     temp = np.zeros(output_shape, dtype=np.float32)
-    counts = np.zeros(output_shape, np.int)
+    counts = np.zeros(output_shape, dtype=np.float32)
     for offset in np.ndindex(factor):
         part = array[tuple(np.s_[o::f] for o, f in zip(offset, factor))]
         indexing_expr = tuple(np.s_[:s] for s in part.shape)
         temp[indexing_expr] += part
         counts[indexing_expr] += 1
-    return np.cast[array.dtype](temp / counts)
+    return _cast_averaged(temp, counts, array.dtype)
+
+
+def _cast_averaged(temp, counts, dtype):
+    """Divides the float32 sums in temp by counts in place and converts to dtype.
+
+    Integer outputs are rounded to the nearest value rather than truncated.
+    """
+    np.divide(temp, counts, out=temp)
+    if np.issubdtype(dtype, np.integer):
+        np.rint(temp, out=temp)
+    return temp.astype(dtype, copy=False)
 
 
 def downsample_with_striding(array, factor):
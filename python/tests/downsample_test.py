@@ -0,0 +1,47 @@
+# @license
+# Copyright 2018 Google Inc.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division
+
+import numpy as np
+from neuroglancer import downsample
+
+
+def test_downsample_with_averaging_rounds():
+    # Integer outputs are rounded to the nearest value, with ties going to the even value, rather
+    # than truncated.
+    data = np.array([[1, 2, 2, 3], [2, 2, 2, 3]], dtype=np.uint8)
+    result = downsample.downsample_with_averaging(data, (2, 2))
+    np.testing.assert_array_equal(result, [[2, 2]])
+
+    data = np.array([[1, 2, 3, 4, 7]], dtype=np.uint16)
+    result = downsample.downsample_with_averaging(data, (1, 2))
+    assert result.dtype == np.uint16
+    np.testing.assert_array_equal(result, [[2, 4, 7]])
+
+
+def test_downsample_with_averaging_divisible():
+    data = np.arange(2 * 4 * 6, dtype=np.uint8).reshape(2, 4, 6)
+    result = downsample.downsample_with_averaging(data, (1, 2, 2))
+    assert result.dtype == np.uint8
+    assert result.shape == (2, 2, 3)
+    expected = np.rint(data.reshape(2, 2, 2, 3, 2).mean(axis=(2, 4)))
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_downsample_with_averaging_partial_blocks():
+    data = np.arange(3 * 5, dtype=np.float32).reshape(3, 5)
+    result = downsample.downsample_with_averaging(data, (2, 2))
+    expected = np.array([[3, 5, 6.5], [10.5, 12.5, 14]], dtype=np.float32)
+    np.testing.assert_array_equal(result, expected)